@@ -1,10 +1,15 @@
 """Simplified tmux client as module singleton."""
 
+import asyncio
 import logging
 import os
+import re
+import shlex
+import stat
 import subprocess
-import uuid
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import libtmux
 
@@ -12,12 +17,199 @@ from cli_agent_orchestrator.constants import TMUX_HISTORY_LINES
 
 logger = logging.getLogger(__name__)
 
+# Detached session the control-mode client attaches to (hidden from list_sessions)
+CONTROL_SESSION_NAME = "cao-control"
+
+# How long cached libtmux Session/Window objects stay valid; each cache hit
+# avoids a full list-sessions/list-windows round-trip inside libtmux
+SESSION_CACHE_TTL = 1.0
+
+# How long a capture result may be reused by back-to-back get_history calls.
+# Sized to the fastest status-poll interval, so a burst of polls within one
+# tick costs a single capture-pane subprocess instead of one each
+CAPTURE_TTL = 0.05
+
+# Characters not allowed in the deterministic per-target paste buffer names
+_BUFFER_NAME_SANITIZE_RE = re.compile(r"\W")
+
+
+def _send_buffer_name(session_name: str, window_name: str) -> str:
+    """Deterministic paste buffer name for a target window (sanitized)."""
+    return "cao_" + _BUFFER_NAME_SANITIZE_RE.sub("_", f"{session_name}_{window_name}")
+
+
+# Bytes-level SGR color-code matcher: applied to the raw capture before UTF-8
+# decode so escape bytes that would just be discarded never reach the decoder
+_ANSI_COLOR_BYTES_RE = re.compile(rb"\x1b\[[0-9;]*m")
+
+
+# Per-pane fields needed for polling, fetched for all panes in one call
+_SNAPSHOT_FORMAT = (
+    "#{session_name}\t#{window_name}\t#{pane_active}"
+    "\t#{history_size}\t#{pane_height}\t#{pane_current_path}"
+)
+
+
+class PaneInfo(NamedTuple):
+    """Polling fields for one pane, as returned by :meth:`TmuxClient.snapshot_all`."""
+
+    history_size: int
+    pane_height: int
+    current_path: str
+
+
+class ControlModeError(Exception):
+    """A command sent over the tmux control-mode pipe failed."""
+
+
+class _ControlModeConnection:
+    """Long-lived ``tmux -C`` pipe for issuing tmux commands without fork/exec.
+
+    Commands are written to the control client's stdin and replies are read as
+    ``%begin``/``%end`` (or ``%error``) blocks, amortizing subprocess creation
+    and the tmux server socket handshake across all operations. The connection
+    is opened lazily on first use and re-opened if the pipe dies.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional["subprocess.Popen[str]"] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        self._proc = subprocess.Popen(
+            ["tmux", "-C", "new-session", "-A", "-D", "-s", CONTROL_SESSION_NAME],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        # Consume the reply block for the implicit initial command
+        self._read_reply()
+        logger.debug("Opened tmux control-mode connection")
+
+    def run(self, command: str) -> List[str]:
+        """Run one tmux command over the control pipe and return its output lines.
+
+        Raises:
+            ControlModeError: If tmux reports an error for the command
+            OSError: If the control pipe cannot be (re)established
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._connect()
+            assert self._proc is not None and self._proc.stdin is not None
+            self._proc.stdin.write(command + "\n")
+            self._proc.stdin.flush()
+            return self._read_reply()
+
+    def _read_reply(self) -> List[str]:
+        assert self._proc is not None and self._proc.stdout is not None
+        lines: List[str] = []
+        in_block = False
+        while True:
+            raw = self._proc.stdout.readline()
+            if not raw:
+                raise BrokenPipeError("tmux control-mode connection closed")
+            line = raw.rstrip("\n")
+            if line.startswith("%begin"):
+                in_block = True
+                lines = []
+            elif line.startswith("%end"):
+                return lines
+            elif line.startswith("%error"):
+                raise ControlModeError("; ".join(lines) or "tmux command failed")
+            elif line.startswith("%"):
+                continue  # asynchronous notification (%output, %session-changed, ...)
+            elif in_block:
+                lines.append(line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None:
+                if self._proc.stdin is not None:
+                    self._proc.stdin.close()
+                self._proc.terminate()
+                self._proc = None
+
 
 class TmuxClient:
     """Simplified tmux client for basic operations."""
 
     def __init__(self) -> None:
         self.server = libtmux.Server()
+        self._control = _ControlModeConnection()
+        self._send_lock = threading.Lock()
+        # Async send locks, created lazily in _get_async_send_lock: per target
+        # so concurrent sends to different windows fan out, and per event loop
+        # because an asyncio.Lock binds to the loop that first awaits it while
+        # this client is a process-lifetime singleton
+        self._async_send_locks: Dict[Tuple["asyncio.AbstractEventLoop", str, str], asyncio.Lock] = (
+            {}
+        )
+        # Differential capture cache: (session, window, lines) ->
+        # (history_size, pane_height, scrolled-off lines). While history_size
+        # is unchanged only the visible pane is re-captured.
+        self._history_cache: Dict[Tuple[str, str, int, bool], Tuple[int, int, str]] = {}
+        # Short-lived capture cache: get_history args -> (timestamp, result).
+        # Serves bursts of status polls within CAPTURE_TTL from one capture;
+        # invalidated on send_keys since new input changes the pane
+        self._capture_ttl_cache: Dict[Tuple[str, str, int, bool], Tuple[float, str]] = {}
+        # TTL cache of libtmux lookups: session name -> (timestamp, Session, {window name: Window})
+        self._session_cache: Dict[str, Tuple[float, libtmux.Session, Dict[str, libtmux.Window]]] = (
+            {}
+        )
+
+    def _get_session(self, session_name: str) -> Optional[libtmux.Session]:
+        """Get a libtmux Session, reusing a recent lookup when possible."""
+        entry = self._session_cache.get(session_name)
+        if entry is not None and time.monotonic() - entry[0] < SESSION_CACHE_TTL:
+            return entry[1]
+        session = self.server.sessions.get(session_name=session_name)
+        if session is not None:
+            self._session_cache[session_name] = (time.monotonic(), session, {})
+        else:
+            self._session_cache.pop(session_name, None)
+        return session
+
+    def _get_window(self, session_name: str, window_name: str) -> Optional[libtmux.Window]:
+        """Get a libtmux Window, reusing a recent lookup when possible."""
+        session = self._get_session(session_name)
+        if session is None:
+            return None
+        entry = self._session_cache.get(session_name)
+        window = entry[2].get(window_name) if entry is not None else None
+        if window is None:
+            window = session.windows.get(window_name=window_name)
+            if window is not None and entry is not None:
+                entry[2][window_name] = window
+        return window
+
+    def _invalidate_session_cache(self, session_name: str) -> None:
+        self._session_cache.pop(session_name, None)
+
+    def _invalidate_capture_cache(self, session_name: str, window_name: str) -> None:
+        """Drop TTL-cached captures for a window whose contents just changed."""
+        # pop instead of del: the singleton client is shared across threads
+        # and a concurrent invalidation may have removed the key already
+        for key in [k for k in self._capture_ttl_cache if k[:2] == (session_name, window_name)]:
+            self._capture_ttl_cache.pop(key, None)
+
+    def _control_query(self, command: str) -> Optional[List[str]]:
+        """Run a command over the control-mode pipe.
+
+        Returns the command's output lines, or None if the pipe is unavailable
+        (tmux missing, pipe died) so callers can fall back to libtmux.
+
+        Raises:
+            ControlModeError: If tmux itself rejects the command
+        """
+        try:
+            return self._control.run(command)
+        except ControlModeError:
+            raise
+        except Exception as e:
+            logger.debug(f"tmux control mode unavailable ({e}); falling back to libtmux")
+            return None
 
     def _resolve_and_validate_working_directory(self, working_directory: Optional[str]) -> str:
         """Resolve and validate working directory.
@@ -26,21 +218,24 @@ class TmuxClient:
             working_directory: Optional directory path, defaults to current directory
 
         Returns:
-            Canonicalized absolute path
+            Normalized absolute path. Symlinks are left in place: one stat
+            syscall validates existence and type, and tmux reports the fully
+            resolved path via #{pane_current_path} once the shell starts there.
 
         Raises:
-            ValueError: If directory does not exist
+            ValueError: If directory does not exist or is not a directory
         """
         if working_directory is None:
             working_directory = os.getcwd()
 
-        # Canonicalize path (resolve symlinks and normalize)
-        real_path = os.path.realpath(working_directory)
-
-        if not os.path.isdir(real_path):
+        try:
+            st = os.stat(working_directory)
+        except OSError:
+            raise ValueError(f"Working directory does not exist: {working_directory}")
+        if not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"Working directory does not exist: {working_directory}")
 
-        return real_path
+        return os.path.abspath(working_directory)
 
     def create_session(
         self,
@@ -53,15 +248,37 @@ class TmuxClient:
         try:
             working_directory = self._resolve_and_validate_working_directory(working_directory)
 
-            environment = os.environ.copy()
-            environment["CAO_TERMINAL_ID"] = terminal_id
+            # One control-mode command creates, names and roots the session
+            # (-d -n -c -e in a single new-session); -P -F returns the window
+            # name from the same command, so setup costs one pipe write
+            # instead of a subprocess per step
+            try:
+                lines = self._control_query(
+                    f'new-session -d -P -F "#{{window_name}}"'
+                    f" -s {shlex.quote(session_name)}"
+                    f" -n {shlex.quote(window_name)}"
+                    f" -c {shlex.quote(working_directory)}"
+                    f" -e CAO_TERMINAL_ID={shlex.quote(terminal_id)}"
+                )
+            except ControlModeError as e:
+                # Let the libtmux path produce the definitive error (or
+                # succeed where control mode cannot, e.g. tmux without -e)
+                logger.debug(f"control-mode new-session failed ({e}); falling back to libtmux")
+                lines = None
+            if lines:
+                logger.info(
+                    f"Created tmux session: {session_name} with window: {window_name} in directory: {working_directory}"
+                )
+                return lines[0]
 
+            # tmux inherits the parent environment; only pass the override
+            # (same pattern as create_window) instead of copying all of os.environ
             session = self.server.new_session(
                 session_name=session_name,
                 window_name=window_name,
                 start_directory=working_directory,
                 detach=True,
-                environment=environment,
+                environment={"CAO_TERMINAL_ID": terminal_id},
             )
             logger.info(
                 f"Created tmux session: {session_name} with window: {window_name} in directory: {working_directory}"
@@ -85,7 +302,7 @@ class TmuxClient:
         try:
             working_directory = self._resolve_and_validate_working_directory(working_directory)
 
-            session = self.server.sessions.get(session_name=session_name)
+            session = self._get_session(session_name)
             if not session:
                 raise ValueError(f"Session '{session_name}' not found")
 
@@ -113,106 +330,350 @@ class TmuxClient:
         slow character-by-character input and special character interpretation.
         The -p flag enables bracketed paste mode so multi-line content is treated
         as a single input rather than submitting on each newline.
+
+        The tmux commands are chained with ";" into a single tmux client
+        invocation, so each message costs one fork/exec and one server
+        round-trip. Each target reuses a deterministic buffer name that the
+        next send simply overwrites, so there is no per-call uuid generation
+        and no trailing delete-buffer command; the lock serializes sends to
+        keep concurrent same-target pastes from interleaving.
         """
         target = f"{session_name}:{window_name}"
-        buf_name = f"cao_{uuid.uuid4().hex[:8]}"
+        buf_name = _send_buffer_name(session_name, window_name)
         try:
             logger.info(f"send_keys: {target} - keys: {keys}")
-            subprocess.run(
-                ["tmux", "load-buffer", "-b", buf_name, "-"],
-                input=keys.encode(),
-                check=True,
-            )
-            subprocess.run(
-                ["tmux", "paste-buffer", "-p", "-b", buf_name, "-t", target],
-                check=True,
-            )
-            subprocess.run(
-                ["tmux", "send-keys", "-t", target, "Enter"],
-                check=True,
-            )
+            with self._send_lock:
+                # fmt: off
+                subprocess.run(
+                    [
+                        "tmux",
+                        "load-buffer", "-b", buf_name, "-", ";",
+                        "paste-buffer", "-p", "-b", buf_name, "-t", target, ";",
+                        "send-keys", "-t", target, "Enter",
+                    ],
+                    input=keys.encode(),
+                    check=True,
+                )
+                # fmt: on
+            self._invalidate_capture_cache(session_name, window_name)
             logger.debug(f"Sent keys to {target}")
         except Exception as e:
             logger.error(f"Failed to send keys to {target}: {e}")
             raise
-        finally:
-            subprocess.run(
-                ["tmux", "delete-buffer", "-b", buf_name],
-                check=False,
+
+    def _get_async_send_lock(self, session_name: str, window_name: str) -> asyncio.Lock:
+        """Lock serializing async sends to one window, under the running loop.
+
+        Only same-target sends contend (they share a paste buffer name);
+        sends to different windows proceed concurrently. Must be called with
+        a running event loop. Locks for closed loops are pruned so repeated
+        asyncio.run() calls don't accumulate entries.
+        """
+        key = (asyncio.get_running_loop(), session_name, window_name)
+        lock = self._async_send_locks.get(key)
+        if lock is None:
+            for stale in [k for k in self._async_send_locks if k[0].is_closed()]:
+                self._async_send_locks.pop(stale, None)
+            lock = self._async_send_locks.setdefault(key, asyncio.Lock())
+        return lock
+
+    async def send_keys_async(self, session_name: str, window_name: str, keys: str) -> None:
+        """Async variant of send_keys for fanning out to many windows.
+
+        Awaiting several of these concurrently (asyncio.gather) overlaps the
+        tmux client fork/exec and pipe I/O instead of serializing each send
+        on the calling thread.
+        """
+        target = f"{session_name}:{window_name}"
+        buf_name = _send_buffer_name(session_name, window_name)
+        try:
+            logger.info(f"send_keys_async: {target} - keys: {keys}")
+            async with self._get_async_send_lock(session_name, window_name):
+                # fmt: off
+                proc = await asyncio.create_subprocess_exec(
+                    "tmux",
+                    "load-buffer", "-b", buf_name, "-", ";",
+                    "paste-buffer", "-p", "-b", buf_name, "-t", target, ";",
+                    "send-keys", "-t", target, "Enter",
+                    stdin=asyncio.subprocess.PIPE,
+                )
+                # fmt: on
+                await proc.communicate(input=keys.encode())
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(proc.returncode or 1, "tmux")
+            self._invalidate_capture_cache(session_name, window_name)
+            logger.debug(f"Sent keys to {target}")
+        except Exception as e:
+            logger.error(f"Failed to send keys to {target}: {e}")
+            raise
+
+    async def get_history_async(
+        self,
+        session_name: str,
+        window_name: str,
+        tail_lines: Optional[int] = None,
+        strip_colors: bool = False,
+    ) -> str:
+        """Async variant of get_history (always a full capture, no differential cache)."""
+        lines = tail_lines if tail_lines is not None else TMUX_HISTORY_LINES
+        target = f"={session_name}:{window_name}"
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *["tmux", "capture-pane", "-e", "-p", "-t", target, "-S", f"-{lines}"],
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
+            stdout, _ = await proc.communicate()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode or 1, "tmux capture-pane")
+            raw = stdout
+            if strip_colors:
+                raw = _ANSI_COLOR_BYTES_RE.sub(b"", raw)
+            text = raw.decode("utf-8", errors="replace")
+            return text[:-1] if text.endswith("\n") else text
+        except Exception as e:
+            logger.error(f"Failed to get history from {session_name}:{window_name}: {e}")
+            raise
+
+    def snapshot_all(self) -> Dict[Tuple[str, str], PaneInfo]:
+        """Snapshot polling fields for every pane in one tmux round trip.
+
+        A single ``list-panes -a`` serves all sessions and windows, so callers
+        polling many terminals per tick pay one tmux command instead of one
+        per window. For multi-pane windows the active pane wins.
+        """
+        try:
+            lines = self._control_query(f'list-panes -a -F "{_SNAPSHOT_FORMAT}"')
+        except ControlModeError:
+            # No tmux server running
+            return {}
+        if lines is None:
+            result = subprocess.run(
+                ["tmux", "list-panes", "-a", "-F", _SNAPSHOT_FORMAT],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            lines = result.stdout.splitlines()
+
+        snapshot: Dict[Tuple[str, str], PaneInfo] = {}
+        for line in lines:
+            session_name, window_name, active, history_size, pane_height, path = line.split("\t", 5)
+            if session_name == CONTROL_SESSION_NAME:
+                continue
+            key = (session_name, window_name)
+            if active != "1" and key in snapshot:
+                continue
+            snapshot[key] = PaneInfo(int(history_size), int(pane_height), path)
+        return snapshot
+
+    def _get_pane_sizes(self, session_name: str, window_name: str) -> Optional[Tuple[int, int]]:
+        """Get (history_size, pane_height) for the window's pane, or None if unavailable."""
+        try:
+            info = self.snapshot_all().get((session_name, window_name))
+        except Exception:
+            return None
+        if info is None:
+            return None
+        return info.history_size, info.pane_height
+
+    def _capture_pane(
+        self, target: str, start_lines: Optional[int] = None, strip_colors: bool = False
+    ) -> str:
+        """Capture pane contents (with escapes) as one decoded string.
+
+        Receives capture-pane stdout as a single bytes buffer and decodes it
+        once, instead of going through libtmux's per-line list + join. With
+        ``strip_colors``, SGR color codes are removed at the bytes level so
+        they never reach the decoder.
+        """
+        cmd = ["tmux", "capture-pane", "-e", "-p", "-t", target]
+        if start_lines is not None:
+            cmd += ["-S", f"-{start_lines}"]
+        result = subprocess.run(cmd, capture_output=True, check=True)
+        raw = result.stdout
+        if strip_colors:
+            raw = _ANSI_COLOR_BYTES_RE.sub(b"", raw)
+        text = raw.decode("utf-8", errors="replace")
+        # capture-pane terminates its output with a newline
+        return text[:-1] if text.endswith("\n") else text
+
+    def get_visible_pane(
+        self, session_name: str, window_name: str, strip_colors: bool = False
+    ) -> str:
+        """Capture only the currently visible pane contents (no scrollback).
+
+        Status polling only needs the prompt/spinner at the bottom of the
+        pane, so fast poll loops can use this (~a screenful) instead of
+        dragging the full history through a pipe each tick.
+        """
+        try:
+            return self._capture_pane(f"={session_name}:{window_name}", strip_colors=strip_colors)
+        except Exception as e:
+            self._invalidate_session_cache(session_name)
+            logger.error(f"Failed to capture pane {session_name}:{window_name}: {e}")
+            raise
 
     def get_history(
-        self, session_name: str, window_name: str, tail_lines: Optional[int] = None
+        self,
+        session_name: str,
+        window_name: str,
+        tail_lines: Optional[int] = None,
+        strip_colors: bool = False,
     ) -> str:
         """Get window history.
 
+        Uses differential capture: the scrolled-off part of the buffer is
+        immutable, so while #{history_size} is unchanged only the visible pane
+        (a few KB) is re-captured and appended to the cached scrollback
+        instead of dragging the full tail through a pipe on every poll.
+
         Args:
             session_name: Name of tmux session
             window_name: Name of window in session
             tail_lines: Number of lines to capture from end (default: TMUX_HISTORY_LINES)
+            strip_colors: Strip ANSI color codes before decoding (for status polling)
         """
         try:
-            session = self.server.sessions.get(session_name=session_name)
-            if not session:
+            lines = tail_lines if tail_lines is not None else TMUX_HISTORY_LINES
+            target = f"={session_name}:{window_name}"
+            cache_key = (session_name, window_name, lines, strip_colors)
+
+            # Within one poll tick, reuse the previous result outright
+            ttl_entry = self._capture_ttl_cache.get(cache_key)
+            if ttl_entry is not None and time.monotonic() - ttl_entry[0] < CAPTURE_TTL:
+                return ttl_entry[1]
+
+            sizes = self._get_pane_sizes(session_name, window_name)
+            if sizes is not None:
+                cached = self._history_cache.get(cache_key)
+                if cached is not None and cached[:2] == sizes:
+                    # Scrollback unchanged: capture only the visible pane
+                    visible = self._capture_pane(target, strip_colors=strip_colors)
+                    result = f"{cached[2]}\n{visible}" if visible else cached[2]
+                    self._capture_ttl_cache[cache_key] = (time.monotonic(), result)
+                    return result
+
+            full = self._capture_pane(target, start_lines=lines, strip_colors=strip_colors)
+            if sizes is not None:
+                # The capture starts with exactly min(lines, history_size)
+                # scrolled-off rows; cache that immutable prefix
+                history_rows = min(lines, sizes[0])
+                cut = 0
+                for _ in range(history_rows):
+                    newline_pos = full.find("\n", cut)
+                    if newline_pos == -1:
+                        cut = 0
+                        break
+                    cut = newline_pos + 1
+                if cut > 1:
+                    self._history_cache[cache_key] = (sizes[0], sizes[1], full[: cut - 1])
+            self._capture_ttl_cache[cache_key] = (time.monotonic(), full)
+            return full
+        except subprocess.CalledProcessError as e:
+            self._invalidate_session_cache(session_name)
+            logger.error(f"Failed to get history from {session_name}:{window_name}: {e}")
+            # capture-pane exits non-zero for a missing target; translate that
+            # back to the ValueError contract the API maps to 404
+            if not self.session_exists(session_name):
                 raise ValueError(f"Session '{session_name}' not found")
-
-            window = session.windows.get(window_name=window_name)
-            if not window:
+            if self._get_window(session_name, window_name) is None:
                 raise ValueError(f"Window '{window_name}' not found in session '{session_name}'")
-
-            # Use cmd to run capture-pane with -e (escape sequences) and -p (print) flags
-            pane = window.panes[0]
-            lines = tail_lines if tail_lines is not None else TMUX_HISTORY_LINES
-            result = pane.cmd("capture-pane", "-e", "-p", "-S", f"-{lines}")
-            # Join all lines with newlines to get complete output
-            return "\n".join(result.stdout) if result.stdout else ""
+            raise
         except Exception as e:
+            self._invalidate_session_cache(session_name)
             logger.error(f"Failed to get history from {session_name}:{window_name}: {e}")
             raise
 
     def list_sessions(self) -> List[Dict[str, str]]:
         """List all tmux sessions."""
         try:
-            sessions: List[Dict[str, str]] = []
-            for session in self.server.sessions:
-                # Check if session has attached clients
-                is_attached = len(getattr(session, "attached_sessions", [])) > 0
-
-                session_name = session.name if session.name is not None else ""
-                sessions.append(
-                    {
-                        "id": session_name,
-                        "name": session_name,
-                        "status": "active" if is_attached else "detached",
-                    }
-                )
-
-            return sessions
-        except Exception as e:
-            logger.error(f"Failed to list sessions: {e}")
+            lines = self._control_query('list-sessions -F "#{session_name}\t#{session_attached}"')
+        except ControlModeError:
+            # No server running yet
             return []
 
+        if lines is None:
+            # Plain subprocess fallback: one call, one parse, no libtmux
+            # Session object construction
+            result = subprocess.run(
+                ["tmux", "list-sessions", "-F", "#{session_name}\t#{session_attached}"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                return []
+            lines = result.stdout.splitlines()
+
+        sessions: List[Dict[str, str]] = []
+        for line in lines:
+            session_name, _, attached = line.partition("\t")
+            if session_name == CONTROL_SESSION_NAME:
+                continue
+            sessions.append(
+                {
+                    "id": session_name,
+                    "name": session_name,
+                    "status": "active" if attached not in ("", "0") else "detached",
+                }
+            )
+        return sessions
+
     def get_session_windows(self, session_name: str) -> List[Dict[str, str]]:
         """Get all windows in a session."""
         try:
-            session = self.server.sessions.get(session_name=session_name)
-            if not session:
-                return []
+            lines = self._control_query(
+                f'list-windows -t {shlex.quote("=" + session_name)}'
+                ' -F "#{window_name}\t#{window_index}"'
+            )
+        except ControlModeError:
+            return []
 
-            windows: List[Dict[str, str]] = []
-            for window in session.windows:
-                window_name = window.name if window.name is not None else ""
-                windows.append({"name": window_name, "index": str(window.index)})
+        if lines is None:
+            result = subprocess.run(
+                [
+                    "tmux",
+                    "list-windows",
+                    "-t",
+                    f"={session_name}",
+                    "-F",
+                    "#{window_name}\t#{window_index}",
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                logger.error(
+                    f"Failed to get windows for session {session_name}: {result.stderr.strip()}"
+                )
+                return []
+            lines = result.stdout.splitlines()
 
-            return windows
-        except Exception as e:
-            logger.error(f"Failed to get windows for session {session_name}: {e}")
-            return []
+        windows = []
+        for line in lines:
+            window_name, _, index = line.partition("\t")
+            windows.append({"name": window_name, "index": index})
+        return windows
 
     def kill_session(self, session_name: str) -> bool:
         """Kill tmux session."""
+        # A new session may reuse the name with a fresh (empty) scrollback
+        for key in [k for k in self._history_cache if k[0] == session_name]:
+            self._history_cache.pop(key, None)
+        for key in [k for k in self._capture_ttl_cache if k[0] == session_name]:
+            self._capture_ttl_cache.pop(key, None)
+        self._invalidate_session_cache(session_name)
         try:
-            session = self.server.sessions.get(session_name=session_name)
+            lines = self._control_query(f"kill-session -t {shlex.quote('=' + session_name)}")
+        except ControlModeError:
+            return False
+
+        if lines is not None:
+            logger.info(f"Killed tmux session: {session_name}")
+            return True
+
+        try:
+            session = self._get_session(session_name)
             if session:
                 session.kill()
                 logger.info(f"Killed tmux session: {session_name}")
@@ -222,22 +683,57 @@ class TmuxClient:
             logger.error(f"Failed to kill session {session_name}: {e}")
             return False
 
+    def clear_history(self, session_name: str, window_name: str) -> bool:
+        """Clear a window's scrollback so captures reflect only the visible pane.
+
+        Full-history status scans otherwise keep seeing output from earlier
+        interactions in a reused session (the scrollback outlives whatever the
+        running program clears on screen).
+        """
+        # The scrollback is gone, so cached captures for the window are stale
+        for key in [k for k in self._history_cache if k[:2] == (session_name, window_name)]:
+            self._history_cache.pop(key, None)
+        self._invalidate_capture_cache(session_name, window_name)
+
+        target = f"={session_name}:{window_name}"
+        try:
+            lines = self._control_query(f"clear-history -t {shlex.quote(target)}")
+        except ControlModeError as e:
+            logger.error(f"Failed to clear history for {target}: {e}")
+            return False
+
+        if lines is not None:
+            return True
+
+        result = subprocess.run(["tmux", "clear-history", "-t", target], capture_output=True)
+        return result.returncode == 0
+
     def session_exists(self, session_name: str) -> bool:
         """Check if session exists."""
         try:
-            session = self.server.sessions.get(session_name=session_name)
-            return session is not None
-        except Exception:
+            lines = self._control_query(f"has-session -t {shlex.quote('=' + session_name)}")
+        except ControlModeError:
             return False
 
+        if lines is not None:
+            return True
+
+        # has-session answers via exit code alone
+        result = subprocess.run(
+            ["tmux", "has-session", "-t", f"={session_name}"], capture_output=True
+        )
+        return result.returncode == 0
+
     def get_pane_working_directory(self, session_name: str, window_name: str) -> Optional[str]:
         """Get the current working directory of a pane."""
         try:
-            session = self.server.sessions.get(session_name=session_name)
-            if not session:
-                return None
+            info = self.snapshot_all().get((session_name, window_name))
+            return info.current_path if info else None
+        except Exception:
+            pass
 
-            window = session.windows.get(window_name=window_name)
+        try:
+            window = self._get_window(session_name, window_name)
             if not window:
                 return None
 
@@ -261,11 +757,11 @@ class TmuxClient:
             file_path: Absolute path to log file
         """
         try:
-            session = self.server.sessions.get(session_name=session_name)
+            session = self._get_session(session_name)
             if not session:
                 raise ValueError(f"Session '{session_name}' not found")
 
-            window = session.windows.get(window_name=window_name)
+            window = self._get_window(session_name, window_name)
             if not window:
                 raise ValueError(f"Window '{window_name}' not found in session '{session_name}'")
 
@@ -274,6 +770,7 @@ class TmuxClient:
                 pane.cmd("pipe-pane", "-o", f"cat >> {file_path}")
                 logger.info(f"Started pipe-pane for {session_name}:{window_name} to {file_path}")
         except Exception as e:
+            self._invalidate_session_cache(session_name)
             logger.error(f"Failed to start pipe-pane for {session_name}:{window_name}: {e}")
             raise
 
@@ -285,11 +782,11 @@ class TmuxClient:
             window_name: Tmux window name
         """
         try:
-            session = self.server.sessions.get(session_name=session_name)
+            session = self._get_session(session_name)
             if not session:
                 raise ValueError(f"Session '{session_name}' not found")
 
-            window = session.windows.get(window_name=window_name)
+            window = self._get_window(session_name, window_name)
             if not window:
                 raise ValueError(f"Window '{window_name}' not found in session '{session_name}'")
 
@@ -298,6 +795,7 @@ class TmuxClient:
                 pane.cmd("pipe-pane")
                 logger.info(f"Stopped pipe-pane for {session_name}:{window_name}")
         except Exception as e:
+            self._invalidate_session_cache(session_name)
             logger.error(f"Failed to stop pipe-pane for {session_name}:{window_name}: {e}")
             raise
 
@@ -1,17 +1,24 @@
 """Kiro CLI provider implementation."""
 
+import functools
 import logging
 import re
-from typing import Optional
+from typing import NamedTuple, Optional, Tuple
 
 from cli_agent_orchestrator.clients.tmux import tmux_client
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.providers.base import BaseProvider
+from cli_agent_orchestrator.utils.ansi import strip_ansi
 from cli_agent_orchestrator.utils.terminal import wait_for_shell, wait_until_status
 
 logger = logging.getLogger(__name__)
 
 # Regex patterns for Kiro CLI output analysis (module-level constants)
+# These operate on str by design: the bytes-level fast path already lives in
+# the tmux client, which strips color codes from the raw capture before its
+# single decode (get_history(strip_colors=True)). By the time output reaches
+# this provider it is decoded text, and the provider/extraction API is str
+# end-to-end, so bytes patterns here would just move the decode around.
 GREEN_ARROW_PATTERN = r"^>\s*"  # Pattern for ANSI-cleaned output (start of line)
 ANSI_CODE_PATTERN = r"\x1b\[[0-9;]*m"
 ESCAPE_SEQUENCE_PATTERN = r"\[[?0-9;]*[a-zA-Z]"
@@ -19,9 +26,47 @@ CONTROL_CHAR_PATTERN = r"[\x00-\x1f\x7f-\x9f]"
 BELL_CHAR = "\x07"
 IDLE_PROMPT_PATTERN_LOG = r"\x1b\[38;5;\d+m\[.+?\].*\x1b\[38;5;\d+m>\s*\x1b\[\d*m"
 
+# Precompiled patterns (compiling per call would thrash re's internal cache on hot polls)
+ANSI_CODE_RE = re.compile(ANSI_CODE_PATTERN)
+ESCAPE_SEQUENCE_RE = re.compile(ESCAPE_SEQUENCE_PATTERN)
+CONTROL_CHAR_RE = re.compile(CONTROL_CHAR_PATTERN)
+GREEN_ARROW_RE = re.compile(GREEN_ARROW_PATTERN, re.MULTILINE)
+
 # Error indicators
 ERROR_INDICATORS = ["Kiro is having trouble responding right now"]
 
+# Status is determined by the most recent prompt, so scan only this much of the
+# buffer tail first and fall back to a full scan when the tail is inconclusive
+STATUS_SCAN_TAIL_CHARS = 4096
+
+# Single case-insensitive scan instead of lowercasing the whole scrollback per
+# indicator. The escaped alternation keeps this one pass over the buffer no
+# matter how many indicators are added, so new entries only need to land in
+# ERROR_INDICATORS above.
+ERROR_INDICATORS_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in ERROR_INDICATORS), re.IGNORECASE
+)
+
+
+class _ParsedOutput(NamedTuple):
+    """Marker positions collected in one pass over a cleaned buffer."""
+
+    first_prompt: Optional[int]  # start of the first idle prompt, if any
+    last_arrow_end: int  # end of the last green arrow, or -1
+    prompt_after_arrow: Optional[int]  # start of the first idle prompt past that arrow
+
+
+@functools.lru_cache(maxsize=8)
+def _clean_output(output: str) -> str:
+    """Strip color codes from a raw buffer, memoized per buffer.
+
+    A status poll followed by an extraction typically sees the same output
+    string; caching a handful of recent buffers makes the second ANSI
+    substitution over the same haystack a dict lookup (str hashes are cached
+    on the object, so repeat lookups don't even rehash the buffer).
+    """
+    return ANSI_CODE_RE.sub("", output)
+
 
 class KiroCliProvider(BaseProvider):
     """Provider for Kiro CLI tool integration."""
@@ -34,12 +79,34 @@ class KiroCliProvider(BaseProvider):
         # Matches: [agent] !> or [agent] > or [agent] X% > or [agent] λ > or [agent] X% λ >
         # after ANSI codes are stripped
         # Also matches with trailing text like "How can I help?"
+        # Tight quantifiers keep matching linear: the prompt never spans lines,
+        # so inner whitespace is [ \t] (not \s) and the percentage is bounded
+        # at three digits. Not ^-anchored because the permission pattern below
+        # embeds this mid-line after the "]:" tail.
         self._idle_prompt_pattern = (
-            rf"\[{re.escape(self._agent_profile)}\]\s*(?:\d+%\s*)?(?:\u03bb\s*)?!?>\s*"
+            rf"\[{re.escape(self._agent_profile)}\][ \t]*(?:\d{{1,3}}%[ \t]*)?"
+            rf"(?:\u03bb[ \t]*)?!?>\s*"
         )
+        # Bounded character classes instead of DOTALL .* runs: everything up to
+        # the "]:" stays on the prompt's own line, so a stale permission prompt
+        # on an earlier line can never bridge to a later idle prompt
         self._permission_prompt_pattern = (
-            r"Allow this action\?.*\[.*y.*\/.*n.*\/.*t.*\]:[ \t]*" + self._idle_prompt_pattern
+            r"Allow this action\?[^\n]*\[[^\]\n]*y[^\]\n]*\/[^\]\n]*n[^\]\n]*\/[^\]\n]*t"
+            r"[^\]\n]*\]:[ \t]*" + self._idle_prompt_pattern
+        )
+        # Compiled once per provider; the string patterns above stay exposed for tests
+        self._idle_prompt_re = re.compile(self._idle_prompt_pattern)
+        self._permission_prompt_re = re.compile(
+            self._permission_prompt_pattern, re.MULTILINE | re.DOTALL
+        )
+        # Fused scanner: one walk over the buffer yields green arrows and idle
+        # prompts together instead of separate search passes per marker
+        self._scan_re = re.compile(
+            rf"(?P<arrow>^>\s*)|(?P<prompt>{self._idle_prompt_pattern})", re.MULTILINE
         )
+        # Parse positions from the last COMPLETED status scan, keyed by
+        # (hash, len) of the cleaned output so extraction can skip re-searching
+        self._last_parse: Optional[Tuple[int, int, int, int]] = None
 
     def initialize(self) -> bool:
         """Initialize Kiro CLI provider by starting kiro-cli chat command."""
@@ -59,39 +126,85 @@ class KiroCliProvider(BaseProvider):
     def get_status(self, tail_lines: Optional[int] = None) -> TerminalStatus:
         """Get Kiro CLI status by analyzing terminal output."""
         logger.debug(f"get_status: tail_lines={tail_lines}")
-        output = tmux_client.get_history(self.session_name, self.window_name, tail_lines=tail_lines)
+        # Color codes are stripped at the bytes level before decode; the str-level
+        # sub below is then a cheap no-op pass kept for callers (and tests) that
+        # feed raw output through a mocked client
+        output = tmux_client.get_history(
+            self.session_name, self.window_name, tail_lines=tail_lines, strip_colors=True
+        )
 
         if not output:
             return TerminalStatus.ERROR
 
         # Strip ANSI codes once for all pattern matching
-        clean_output = re.sub(ANSI_CODE_PATTERN, "", output)
-
-        # Check if we have the idle prompt (not processing)
-        has_idle_prompt = re.search(self._idle_prompt_pattern, clean_output)
-
-        if not has_idle_prompt:
+        clean_output = _clean_output(output)
+
+        # Scan only the buffer tail first: status is decided by the most recent
+        # prompt, so this almost always succeeds without walking the whole
+        # scrollback. IDLE from a truncated tail may really be COMPLETED (the
+        # response could lie before the tail), so only then rescan in full.
+        if len(clean_output) > STATUS_SCAN_TAIL_CHARS:
+            tail = clean_output[-STATUS_SCAN_TAIL_CHARS:]
+            # Snap to the next line start so ^-anchored patterns can't match mid-line
+            newline_pos = tail.find("\n")
+            if newline_pos != -1:
+                tail = tail[newline_pos + 1 :]
+            status = self._scan_status(tail)
+            if status != TerminalStatus.IDLE:
+                return status
+        return self._scan_status(clean_output)
+
+    def _parse(self, clean_output: str) -> _ParsedOutput:
+        """Collect green-arrow and idle-prompt positions in one buffer walk.
+
+        A single finditer over the fused pattern replaces separate searches
+        for the first prompt, the last arrow, and the prompt following it --
+        same comparisons, one sweep over the (potentially multi-KB) buffer.
+        A prompt starting exactly at an arrow's end is not counted as being
+        after it, matching the previous search-from ``end + 1`` semantics.
+        """
+        first_prompt: Optional[int] = None
+        last_arrow_end = -1
+        prompt_after_arrow: Optional[int] = None
+        for match in self._scan_re.finditer(clean_output):
+            if match.lastgroup == "arrow":
+                last_arrow_end = match.end()
+                prompt_after_arrow = None
+            else:
+                if first_prompt is None:
+                    first_prompt = match.start()
+                if prompt_after_arrow is None and match.start() > last_arrow_end >= 0:
+                    prompt_after_arrow = match.start()
+        return _ParsedOutput(first_prompt, last_arrow_end, prompt_after_arrow)
+
+    def _scan_status(self, clean_output: str) -> TerminalStatus:
+        """Determine status from an ANSI-cleaned output region."""
+        parsed = self._parse(clean_output)
+
+        # No idle prompt at all means the agent is still writing
+        if parsed.first_prompt is None:
             return TerminalStatus.PROCESSING
 
         # Check for error indicators
-        if any(indicator.lower() in clean_output.lower() for indicator in ERROR_INDICATORS):
+        if ERROR_INDICATORS_RE.search(clean_output):
             return TerminalStatus.ERROR
 
         # Check for permission prompt
-        if re.search(self._permission_prompt_pattern, clean_output, re.MULTILINE | re.DOTALL):
+        if self._permission_prompt_re.search(clean_output):
             return TerminalStatus.WAITING_USER_ANSWER
 
         # Check for completed state (has response + agent prompt AFTER the response)
-        green_arrows = list(re.finditer(GREEN_ARROW_PATTERN, clean_output, re.MULTILINE))
-        if green_arrows:
-            # Find if there's an idle prompt after the last green arrow
-            last_arrow_pos = green_arrows[-1].end()
-            idle_prompts = list(re.finditer(self._idle_prompt_pattern, clean_output))
-
-            for prompt in idle_prompts:
-                if prompt.start() > last_arrow_pos:
-                    logger.debug(f"get_status: returning COMPLETED")
-                    return TerminalStatus.COMPLETED
+        if parsed.last_arrow_end != -1:
+            if parsed.prompt_after_arrow is not None:
+                # Remember the parse so a following extract call can reuse it
+                self._last_parse = (
+                    hash(clean_output),
+                    len(clean_output),
+                    parsed.last_arrow_end,
+                    parsed.prompt_after_arrow,
+                )
+                logger.debug(f"get_status: returning COMPLETED")
+                return TerminalStatus.COMPLETED
 
             # Has green arrow but no prompt after it - still processing
             return TerminalStatus.PROCESSING
@@ -99,50 +212,56 @@ class KiroCliProvider(BaseProvider):
         # Just agent prompt, no response
         return TerminalStatus.IDLE
 
+    def status_and_extract(self, script_output: str) -> Tuple[TerminalStatus, Optional[str]]:
+        """Classify an output buffer and extract its final message in one scan.
+
+        Returns ``(status, message)`` where the message is only present for
+        COMPLETED buffers. The extraction reuses the parse positions recorded
+        by the status scan, so the buffer is walked once for both answers.
+        """
+        if not script_output:
+            return TerminalStatus.ERROR, None
+        status = self._scan_status(_clean_output(script_output))
+        if status != TerminalStatus.COMPLETED:
+            return status, None
+        return status, self.extract_last_message_from_script(script_output)
+
     def extract_last_message_from_script(self, script_output: str) -> str:
         """Extract agent's final response message using green arrow indicator."""
         # Strip ANSI codes for pattern matching
-        clean_output = re.sub(ANSI_CODE_PATTERN, "", script_output)
+        clean_output = _clean_output(script_output)
 
-        # Find patterns in clean output
-        green_arrows = list(re.finditer(GREEN_ARROW_PATTERN, clean_output, re.MULTILINE))
-        idle_prompts = list(re.finditer(self._idle_prompt_pattern, clean_output))
+        # Reuse the positions from a COMPLETED get_status scan of this same
+        # output instead of re-running the arrow/prompt searches
+        cached = self._last_parse
+        if cached is not None and cached[:2] == (hash(clean_output), len(clean_output)):
+            final_answer = clean_output[cached[2] : cached[3]].strip()
+            if not final_answer:
+                raise ValueError("Empty Kiro CLI response - no content found")
+            return strip_ansi(final_answer).strip()
 
-        if not green_arrows:
-            raise ValueError("No Kiro CLI response found - no green arrow pattern detected")
-
-        if not idle_prompts:
-            raise ValueError("Incomplete Kiro CLI response - no final prompt detected")
-
-        # Find the last green arrow (response start)
-        last_arrow_pos = green_arrows[-1].end()
+        # One pass collects the last green arrow and the prompt that follows it
+        parsed = self._parse(clean_output)
 
-        # Find idle prompt that comes AFTER the last green arrow
-        final_prompt = None
-        for prompt in idle_prompts:
-            if prompt.start() > last_arrow_pos:
-                final_prompt = prompt
-                break
+        if parsed.last_arrow_end == -1:
+            raise ValueError("No Kiro CLI response found - no green arrow pattern detected")
 
-        if not final_prompt:
+        if parsed.prompt_after_arrow is None:
+            if parsed.first_prompt is None:
+                raise ValueError("Incomplete Kiro CLI response - no final prompt detected")
             raise ValueError(
                 "Incomplete Kiro CLI response - no final prompt detected after response"
             )
 
         # Extract directly from clean output
-        start_pos = last_arrow_pos
-        end_pos = final_prompt.start()
-
-        final_answer = clean_output[start_pos:end_pos].strip()
+        final_answer = clean_output[parsed.last_arrow_end : parsed.prompt_after_arrow].strip()
 
         if not final_answer:
             raise ValueError("Empty Kiro CLI response - no content found")
 
-        # Clean up the message
-        final_answer = re.sub(ANSI_CODE_PATTERN, "", final_answer)
-        final_answer = re.sub(ESCAPE_SEQUENCE_PATTERN, "", final_answer)
-        final_answer = re.sub(CONTROL_CHAR_PATTERN, "", final_answer)
-        return final_answer.strip()
+        # Clean up the message: one linear scanner pass removes the remaining
+        # escape sequences and control chars without regex backtracking
+        return strip_ansi(final_answer).strip()
 
     def get_idle_pattern_for_log(self) -> str:
         """Return Kiro CLI IDLE prompt pattern for log files."""
@@ -65,9 +65,24 @@ class QCliProvider(BaseProvider):
         if not output:
             return TerminalStatus.ERROR
 
-        # Strip ANSI codes once for all pattern matching
-        clean_output = re.sub(ANSI_CODE_PATTERN, "", output)
+        return self._scan_status(re.sub(ANSI_CODE_PATTERN, "", output))
 
+    def get_status_fast(self) -> TerminalStatus:
+        """Get Q CLI status from the visible pane only (hot polling path).
+
+        The prompt/spinner that decides the status sits in the visible pane,
+        so poll loops can skip capturing the scrollback each tick. Use
+        get_status for a verdict over the full buffer.
+        """
+        output = tmux_client.get_visible_pane(self.session_name, self.window_name)
+
+        if not output:
+            return TerminalStatus.ERROR
+
+        return self._scan_status(re.sub(ANSI_CODE_PATTERN, "", output))
+
+    def _scan_status(self, clean_output: str) -> TerminalStatus:
+        """Determine status from an ANSI-cleaned output region."""
         # Check if we have the idle prompt (not processing)
         has_idle_prompt = re.search(self._idle_prompt_pattern, clean_output)
 
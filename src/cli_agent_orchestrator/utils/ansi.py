@@ -0,0 +1,65 @@
+"""Single-pass scanner for stripping terminal escape noise from CLI output."""
+
+# Control characters removed by the scanner (C0 plus DEL/C1), except where
+# they start a recognized escape sequence that is consumed as a whole
+_CONTROL_CHARS = frozenset(chr(code) for code in (*range(0x00, 0x20), *range(0x7F, 0xA0)))
+
+_PARAM_CHARS = frozenset("0123456789;")
+_BRACKET_PARAM_CHARS = frozenset("?0123456789;")
+
+
+def _match_csi_color(text: str, start: int) -> int:
+    """Return the index just past an ``ESC[...m`` color code at start, or -1."""
+    pos = start + 2  # past ESC and [
+    length = len(text)
+    while pos < length and text[pos] in _PARAM_CHARS:
+        pos += 1
+    if pos < length and text[pos] == "m":
+        return pos + 1
+    return -1
+
+
+def _match_bracket_sequence(text: str, start: int) -> int:
+    """Return the index just past a ``[<params><letter>`` sequence at start, or -1."""
+    pos = start + 1  # past [
+    length = len(text)
+    while pos < length and text[pos] in _BRACKET_PARAM_CHARS:
+        pos += 1
+    if pos < length and text[pos].isascii() and text[pos].isalpha():
+        return pos + 1
+    return -1
+
+
+def strip_ansi(text: str) -> str:
+    """Strip ANSI color codes, escape sequences and control characters.
+
+    One linear pass over the input instead of chained regex substitutions:
+    each position is classified once (color code, bracket escape sequence,
+    control character, or plain text) with no backtracking, which keeps
+    cleanup O(n) even on escape-heavy output.
+    """
+    out = []
+    pos = 0
+    run_start = 0  # start of the current run of plain text to copy verbatim
+    length = len(text)
+    while pos < length:
+        char = text[pos]
+        end = -1
+        if char == "\x1b" and pos + 1 < length and text[pos + 1] == "[":
+            end = _match_csi_color(text, pos)
+        if end == -1 and char in _CONTROL_CHARS:
+            end = pos + 1
+        if end == -1 and char == "[":
+            end = _match_bracket_sequence(text, pos)
+        if end == -1:
+            pos += 1
+            continue
+        if run_start < pos:
+            out.append(text[run_start:pos])
+        pos = end
+        run_start = pos
+    if run_start == 0:
+        return text
+    if run_start < length:
+        out.append(text[run_start:])
+    return "".join(out)
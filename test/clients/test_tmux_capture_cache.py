@@ -0,0 +1,161 @@
+"""Tests for TmuxClient capture caching, invalidation and snapshot parsing."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.clients.tmux import ControlModeError, PaneInfo, TmuxClient
+
+
+@pytest.fixture
+def client():
+    with patch("cli_agent_orchestrator.clients.tmux.libtmux"):
+        return TmuxClient()
+
+
+@pytest.fixture
+def capture_calls(client, monkeypatch):
+    """Stub _capture_pane; records each call's start_lines and pops a canned reply."""
+    calls = []
+    replies = []
+
+    def fake_capture(target, start_lines=None, strip_colors=False):
+        calls.append(start_lines)
+        return replies.pop(0) if replies else ""
+
+    monkeypatch.setattr(client, "_capture_pane", fake_capture)
+    return calls, replies
+
+
+class TestCaptureTtlCache:
+    """Tests for the short-lived capture cache serving poll bursts."""
+
+    def test_burst_served_from_one_capture(self, client, monkeypatch, capture_calls):
+        monkeypatch.setattr(client, "_get_pane_sizes", lambda s, w: None)
+        calls, replies = capture_calls
+        replies += ["out", "out"]
+
+        assert client.get_history("s", "w", tail_lines=50) == "out"
+        assert client.get_history("s", "w", tail_lines=50) == "out"
+
+        assert len(calls) == 1
+
+    def test_cache_keyed_by_strip_colors(self, client, monkeypatch, capture_calls):
+        monkeypatch.setattr(client, "_get_pane_sizes", lambda s, w: None)
+        calls, replies = capture_calls
+        replies += ["raw", "clean"]
+
+        assert client.get_history("s", "w", tail_lines=50) == "raw"
+        assert client.get_history("s", "w", tail_lines=50, strip_colors=True) == "clean"
+
+        assert len(calls) == 2
+
+    def test_send_keys_invalidates_only_its_window(self, client):
+        client._capture_ttl_cache[("s", "w", 50, False)] = (time.monotonic(), "stale")
+        client._capture_ttl_cache[("s", "other", 50, False)] = (time.monotonic(), "kept")
+
+        with patch("cli_agent_orchestrator.clients.tmux.subprocess"):
+            client.send_keys("s", "w", "hi")
+
+        assert ("s", "w", 50, False) not in client._capture_ttl_cache
+        assert ("s", "other", 50, False) in client._capture_ttl_cache
+
+    def test_kill_session_purges_both_caches(self, client, monkeypatch):
+        client._history_cache[("s", "w", 50, False)] = (2, 5, "old")
+        client._capture_ttl_cache[("s", "w", 50, False)] = (time.monotonic(), "old")
+        client._history_cache[("s2", "w", 50, False)] = (2, 5, "kept")
+        client._capture_ttl_cache[("s2", "w", 50, False)] = (time.monotonic(), "kept")
+        monkeypatch.setattr(client, "_control_query", lambda cmd: [])
+
+        assert client.kill_session("s") is True
+
+        assert ("s", "w", 50, False) not in client._history_cache
+        assert ("s", "w", 50, False) not in client._capture_ttl_cache
+        assert ("s2", "w", 50, False) in client._history_cache
+        assert ("s2", "w", 50, False) in client._capture_ttl_cache
+
+
+class TestDifferentialCapture:
+    """Tests for the scrollback-prefix reuse in get_history."""
+
+    def test_unchanged_history_recaptures_only_visible_pane(
+        self, client, monkeypatch, capture_calls
+    ):
+        monkeypatch.setattr(client, "_get_pane_sizes", lambda s, w: (2, 2))
+        calls, replies = capture_calls
+        replies += ["h1\nh2\nv1\nv2", "v1x\nv2x"]
+
+        assert client.get_history("s", "w", tail_lines=50) == "h1\nh2\nv1\nv2"
+        client._capture_ttl_cache.clear()  # step past the poll-burst cache
+
+        assert client.get_history("s", "w", tail_lines=50) == "h1\nh2\nv1x\nv2x"
+        # First call captured the tail (-50), second only the visible pane
+        assert calls == [50, None]
+
+    def test_grown_history_forces_full_recapture(self, client, monkeypatch, capture_calls):
+        sizes = {"v": (2, 2)}
+        monkeypatch.setattr(client, "_get_pane_sizes", lambda s, w: sizes["v"])
+        calls, replies = capture_calls
+        replies += ["h1\nh2\nv1\nv2", "h1\nh2\nh3\nv1\nv2"]
+
+        client.get_history("s", "w", tail_lines=50)
+        client._capture_ttl_cache.clear()
+        sizes["v"] = (3, 2)  # scrollback grew: cached prefix is stale
+
+        assert client.get_history("s", "w", tail_lines=50) == "h1\nh2\nh3\nv1\nv2"
+        assert calls == [50, 50]
+
+    def test_short_capture_does_not_cache_prefix(self, client, monkeypatch, capture_calls):
+        # Fewer captured lines than history rows: no immutable prefix to keep
+        monkeypatch.setattr(client, "_get_pane_sizes", lambda s, w: (5, 2))
+        calls, replies = capture_calls
+        replies += ["only one line", "only one line"]
+
+        client.get_history("s", "w", tail_lines=50)
+        client._capture_ttl_cache.clear()
+        client.get_history("s", "w", tail_lines=50)
+
+        assert calls == [50, 50]
+        assert client._history_cache == {}
+
+
+class TestSnapshotAll:
+    """Tests for the one-call pane snapshot parsing."""
+
+    def test_parses_panes_and_hides_control_session(self, client, monkeypatch):
+        lines = [
+            "s1\tw1\t1\t10\t5\t/home/a",
+            "cao-control\tcontrol\t1\t0\t5\t/",
+        ]
+        monkeypatch.setattr(client, "_control_query", lambda cmd: lines)
+
+        snapshot = client.snapshot_all()
+
+        assert snapshot == {("s1", "w1"): PaneInfo(10, 5, "/home/a")}
+
+    def test_active_pane_wins_in_multi_pane_window(self, client, monkeypatch):
+        lines = [
+            "s1\tw1\t0\t3\t4\t/tmp/x",
+            "s1\tw1\t1\t7\t6\t/tmp/y",
+        ]
+        monkeypatch.setattr(client, "_control_query", lambda cmd: lines)
+
+        assert client.snapshot_all()[("s1", "w1")] == PaneInfo(7, 6, "/tmp/y")
+
+    def test_inactive_pane_does_not_overwrite_active(self, client, monkeypatch):
+        lines = [
+            "s1\tw1\t1\t7\t6\t/tmp/y",
+            "s1\tw1\t0\t3\t4\t/tmp/x",
+        ]
+        monkeypatch.setattr(client, "_control_query", lambda cmd: lines)
+
+        assert client.snapshot_all()[("s1", "w1")] == PaneInfo(7, 6, "/tmp/y")
+
+    def test_no_server_returns_empty_snapshot(self, client, monkeypatch):
+        def raise_error(cmd):
+            raise ControlModeError("no server running")
+
+        monkeypatch.setattr(client, "_control_query", raise_error)
+
+        assert client.snapshot_all() == {}
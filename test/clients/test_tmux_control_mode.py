@@ -0,0 +1,78 @@
+"""Tests for the tmux control-mode connection's reply parsing."""
+
+import io
+
+import pytest
+
+from cli_agent_orchestrator.clients.tmux import ControlModeError, _ControlModeConnection
+
+
+class FakePipeProc:
+    """Stands in for the tmux -C Popen: canned stdout, writable stdin."""
+
+    def __init__(self, reply: str):
+        self.stdout = io.StringIO(reply)
+        self.stdin = io.StringIO()
+
+    def poll(self):
+        return None  # still running
+
+
+def connection_with(reply: str) -> _ControlModeConnection:
+    conn = _ControlModeConnection()
+    conn._proc = FakePipeProc(reply)
+    return conn
+
+
+class TestReadReply:
+    """Tests for %begin/%end/%error block parsing."""
+
+    def test_returns_lines_between_begin_and_end(self):
+        conn = connection_with("%begin 1 1 0\nline1\nline2\n%end 1 1 0\n")
+
+        assert conn._read_reply() == ["line1", "line2"]
+
+    def test_empty_block(self):
+        conn = connection_with("%begin 1 1 0\n%end 1 1 0\n")
+
+        assert conn._read_reply() == []
+
+    def test_error_block_raises_with_message(self):
+        conn = connection_with("%begin 1 1 0\nunknown command: nope\n%error 1 1 0\n")
+
+        with pytest.raises(ControlModeError, match="unknown command: nope"):
+            conn._read_reply()
+
+    def test_notifications_are_skipped(self):
+        # Asynchronous %-notifications may arrive before and inside the block
+        conn = connection_with(
+            "%session-changed $1 cao-control\n"
+            "%begin 1 1 0\n"
+            "line1\n"
+            "%output %1 stray\n"
+            "line2\n"
+            "%end 1 1 0\n"
+        )
+
+        assert conn._read_reply() == ["line1", "line2"]
+
+    def test_lines_outside_block_are_ignored(self):
+        conn = connection_with("noise\n%begin 1 1 0\nline1\n%end 1 1 0\n")
+
+        assert conn._read_reply() == ["line1"]
+
+    def test_eof_raises_broken_pipe(self):
+        conn = connection_with("")
+
+        with pytest.raises(BrokenPipeError):
+            conn._read_reply()
+
+
+class TestRun:
+    """Tests for command write + reply read over an established pipe."""
+
+    def test_writes_command_and_returns_reply(self):
+        conn = connection_with("%begin 1 1 0\nok\n%end 1 1 0\n")
+
+        assert conn.run("list-foo") == ["ok"]
+        assert conn._proc.stdin.getvalue() == "list-foo\n"
@@ -0,0 +1,22 @@
+"""Hand-rolled test doubles for provider tests."""
+
+
+class StubTmuxClient:
+    """Minimal tmux client double: canned history plus recorded calls.
+
+    MagicMock wires up magic methods and call tracking per instance; the hot
+    provider tests only need a fixed get_history return and a call log, so
+    this plain class keeps per-test setup cheap.
+    """
+
+    def __init__(self, history: str = ""):
+        self.history = history
+        self.get_history_calls = []
+        self.send_keys_calls = []
+
+    def get_history(self, *args, **kwargs) -> str:
+        self.get_history_calls.append((args, kwargs))
+        return self.history
+
+    def send_keys(self, *args) -> None:
+        self.send_keys_calls.append(args)
@@ -0,0 +1,79 @@
+"""Shared fixtures for provider tests."""
+
+import json
+import shutil
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from cli_agent_orchestrator.providers.kiro_cli import ANSI_CODE_RE
+
+# Re-exported for tests that only need cleaned text for assertions: the
+# single-pass scanner in utils.ansi is cheaper than running a provider's
+# regex-based extraction pipeline just to check output is escape-free.
+from cli_agent_orchestrator.utils.ansi import strip_ansi  # noqa: F401
+from test.providers._stubs import StubTmuxClient
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Agent the Q CLI integration tests run against, and where Q CLI looks it up
+Q_AGENT_NAME = "agent-q-cli-integration-test"
+Q_AGENT_DIR = Path.home() / ".aws" / "amazonq" / "cli-agents"
+
+
+def pytest_sessionstart(session):
+    """Create the Q CLI integration agent once, before fixture resolution.
+
+    One-time global setup lives here instead of a fixture chain: unit-only
+    runs pay nothing when Q CLI is absent, and integration runs get a single
+    clear setup point. Tests read the agent name via the ensure_test_agent
+    fixture, which skips when this hook found no Q CLI.
+    """
+    if not shutil.which("q"):
+        return
+
+    agent_file = Q_AGENT_DIR / f"{Q_AGENT_NAME}.json"
+    if not agent_file.exists():
+        agent_file.parent.mkdir(parents=True, exist_ok=True)
+        # Resolve the rules glob here, once per session, instead of shipping
+        # the pattern and having Q CLI re-walk the directory on every init
+        rules = sorted(Path(".amazonq/rules").rglob("*.md"))
+        agent_config = {
+            "name": Q_AGENT_NAME,
+            "description": "",
+            "prompt": None,
+            "resources": [f"file://{rule.resolve()}" for rule in rules],
+            "useLegacyMcpJson": True,
+            "model": None,
+        }
+        agent_file.write_text(json.dumps(agent_config, indent=2))
+        print(f"\nCreated test agent '{Q_AGENT_NAME}' at {agent_file}")
+
+    session.config._q_agent_name = Q_AGENT_NAME
+
+
+# Each fixture file in both forms: as captured, and with color codes stripped.
+# Tests that don't exercise ANSI cleaning use .cleaned (matching what the real
+# client returns with strip_colors=True); cleaning-path tests use .raw.
+Fixture = namedtuple("Fixture", "raw cleaned")
+
+
+@pytest.fixture
+def tmux_stub(monkeypatch):
+    """StubTmuxClient injected into the kiro provider module."""
+    stub = StubTmuxClient()
+    monkeypatch.setattr("cli_agent_orchestrator.providers.kiro_cli.tmux_client", stub)
+    return stub
+
+
+@pytest.fixture(scope="session")
+def kiro_fixtures() -> Dict[str, Fixture]:
+    """All provider fixture files, read once per session and keyed by file name."""
+    fixtures = {}
+    for path in FIXTURES_DIR.iterdir():
+        if path.suffix == ".txt":
+            raw = path.read_bytes().decode("utf-8")
+            fixtures[path.name] = Fixture(raw, ANSI_CODE_RE.sub("", raw))
+    return fixtures
@@ -1,10 +1,10 @@
 """Integration tests for Q CLI provider with real Q CLI."""
 
-import json
+import os
 import shutil
-import subprocess
 import time
-from pathlib import Path
+import uuid
+from collections import namedtuple
 
 import pytest
 
@@ -12,57 +12,96 @@ from cli_agent_orchestrator.clients.tmux import tmux_client
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.providers.q_cli import QCliProvider
 from cli_agent_orchestrator.utils.terminal import wait_for_shell
+from test.providers.conftest import Q_AGENT_DIR, strip_ansi
 
 # Mark all tests in this module as integration and slow
 pytestmark = [pytest.mark.integration, pytest.mark.slow]
 
+# One $PATH walk per worker at import, not one per fixture request
+_Q_CLI_PATH = shutil.which("q")
+
+# Most time here is spent waiting on Q CLI, so classes are split into xdist
+# load groups: run with 'pytest -n 4 --dist=loadgroup' to overlap the waits.
+# Classes sharing the session-scoped provider stay in one group; the others
+# use per-test sessions and can run anywhere.
+
+
+def _worker_id() -> str:
+    """xdist worker name, so parallel workers don't collide on session names."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+
+# Result of wait_for_status(record=True): final status plus the distinct
+# statuses observed along the way, in order
+StatusResult = namedtuple("StatusResult", "status transitions")
+
+
+def wait_for_status(provider, targets, timeout=30.0, interval=0.05, record=False):
+    """Poll until the provider reaches one of the target statuses.
+
+    Returns the last observed status either way so callers assert on the
+    result. The short interval bounds test latency by the actual state
+    transition instead of a coarse one-second tick. Polling reads only the
+    visible pane; on timeout one full-buffer get_status gives the verdict.
+
+    With record=True, returns a StatusResult whose transitions list holds
+    each status change seen while polling — only changes are stored, so the
+    fine interval doesn't grow the list.
+    """
+    transitions = []
+    deadline = time.monotonic() + timeout
+    status = provider.get_status_fast()
+    transitions.append(status)
+    while status not in targets and time.monotonic() < deadline:
+        time.sleep(interval)
+        status = provider.get_status_fast()
+        if status != transitions[-1]:
+            transitions.append(status)
+    if status not in targets:
+        status = provider.get_status()
+        if status != transitions[-1]:
+            transitions.append(status)
+    if record:
+        return StatusResult(status, transitions)
+    return status
+
+
+def wait_until(predicate, timeout=2.0, interval=0.02):
+    """Poll predicate until it returns a truthy value or the timeout expires.
+
+    Returns the last predicate result either way. Same event-driven idea as
+    wait_for_status, for conditions that aren't provider statuses.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        value = predicate()
+        if value:
+            return value
+        time.sleep(interval)
+    return predicate()
+
 
 @pytest.fixture(scope="session")
 def q_cli_available():
-    """Check if Q CLI is available and configured."""
-    if not shutil.which("q"):
+    """Path to the q binary, skipping the test when Q CLI is not installed."""
+    if _Q_CLI_PATH is None:
         pytest.skip("Q CLI not installed")
-    return True
+    return _Q_CLI_PATH
 
 
 @pytest.fixture(scope="session")
-def ensure_test_agent(q_cli_available):
-    """Ensure a test agent exists for integration tests."""
-    agent_name = "agent-q-cli-integration-test"
-    agent_dir = Path.home() / ".aws" / "amazonq" / "cli-agents"
-    agent_file = agent_dir / f"{agent_name}.json"
-
-    # Check if agent already exists
-    if agent_file.exists():
-        return agent_name
-
-    # Create agent directory if it doesn't exist
-    agent_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create a minimal test agent configuration
-    agent_config = {
-        "name": agent_name,
-        "description": "",
-        "prompt": None,
-        "resources": ["file://.amazonq/rules/**/*.md"],
-        "useLegacyMcpJson": True,
-        "model": None,
-    }
-
-    # Write agent configuration
-    with open(agent_file, "w") as f:
-        json.dump(agent_config, f, indent=2)
-
-    print(f"\nCreated test agent '{agent_name}' at {agent_file}")
+def ensure_test_agent(pytestconfig):
+    """Name of the test agent created once in pytest_sessionstart (conftest)."""
+    agent_name = getattr(pytestconfig, "_q_agent_name", None)
+    if not agent_name:
+        pytest.skip("Q CLI not installed")
     return agent_name
 
 
 @pytest.fixture
 def test_session_name():
     """Generate a unique test session name."""
-    import uuid
-
-    return f"test-q-cli-{uuid.uuid4().hex[:8]}"
+    return f"test-q-cli-{_worker_id()}-{uuid.uuid4().hex[:8]}"
 
 
 @pytest.fixture
@@ -76,134 +115,110 @@ def cleanup_session(test_session_name):
         pass  # Session may already be cleaned up
 
 
-class TestQCliProviderIntegration:
-    """Integration tests with real Q CLI."""
+@pytest.fixture(scope="session")
+def q_provider(ensure_test_agent, request):
+    """One tmux session with an initialized Q CLI, shared across the suite.
 
-    def test_real_q_chat_initialization(
-        self, ensure_test_agent, test_session_name, cleanup_session
-    ):
-        """Test real Q CLI initialization flow."""
-        # Create a test tmux session
-        terminal_id = "test1234"
-        window_name = "window-0"
-        tmux_client.create_session(test_session_name, window_name, terminal_id)
+    The Q CLI cold start dominates integration wall time, so pay it once;
+    tests reset conversation state through the q_chat fixture instead of
+    re-spawning. Tests that terminate or misconfigure Q CLI (exit, unknown
+    profile, working-directory checks) keep their own per-test sessions.
+    """
+    session_name = f"test-q-cli-{_worker_id()}-{uuid.uuid4().hex[:8]}"
+    window_name = "window-0"
+    terminal_id = "test1234"
 
-        try:
-            # Create provider and initialize (using agent from ensure_test_agent fixture)
-            provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
-            result = provider.initialize()
+    tmux_client.create_session(session_name, window_name, terminal_id)
+    request.addfinalizer(lambda: tmux_client.kill_session(session_name))
 
-            # Verify initialization succeeded
-            assert result is True
+    provider = QCliProvider(terminal_id, session_name, window_name, ensure_test_agent)
+    provider.initialize()
+    return provider, session_name, window_name
 
-            # Give Q CLI a moment to fully initialize
-            time.sleep(2)
 
-            # Verify status is IDLE after initialization
-            status = provider.get_status()
-            assert status == TerminalStatus.IDLE
+@pytest.fixture
+def q_chat(q_provider):
+    """The shared provider, reset to a clean IDLE prompt before each test."""
+    provider, session_name, window_name = q_provider
+    tmux_client.send_keys(session_name, window_name, "/clear")
+
+    if wait_for_status(provider, {TerminalStatus.IDLE}, timeout=10.0) != TerminalStatus.IDLE:
+        pytest.fail("Shared Q CLI session did not return to IDLE after /clear")
+
+    # /clear resets the conversation, not the tmux scrollback: without this,
+    # full-buffer get_status scans still see earlier tests' responses and
+    # report COMPLETED instead of IDLE
+    tmux_client.clear_history(session_name, window_name)
+
+    return provider, session_name, window_name
+
+
+@pytest.mark.xdist_group(name="q-cli-shared")
+class TestQCliProviderIntegration:
+    """Integration tests with real Q CLI."""
+
+    def test_real_q_chat_initialization(self, q_chat):
+        """Test real Q CLI initialization flow."""
+        provider, _session_name, _window_name = q_chat
 
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+        # The shared fixture already ran initialize(); verify it left Q CLI IDLE
+        status = provider.get_status()
+        assert status == TerminalStatus.IDLE
 
-    def test_real_q_chat_simple_query(self, ensure_test_agent, test_session_name, cleanup_session):
+    def test_real_q_chat_simple_query(self, q_chat):
         """Test real Q CLI with a simple query."""
-        # Create a test tmux session
-        terminal_id = "test1234"
-        window_name = "window-0"
-        tmux_client.create_session(test_session_name, window_name, terminal_id)
+        provider, session_name, window_name = q_chat
 
-        try:
-            # Initialize Q CLI (using agent from ensure_test_agent fixture)
-            provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
-            provider.initialize()
+        # Send a simple query
+        simple_query = "Say 'Hello, integration test!'"
+        tmux_client.send_keys(session_name, window_name, simple_query)
 
-            # Wait for IDLE status
-            time.sleep(2)
-            assert provider.get_status() == TerminalStatus.IDLE
+        # Wait for processing
+        status = wait_for_status(
+            provider, {TerminalStatus.PROCESSING, TerminalStatus.COMPLETED}, timeout=5.0
+        )
+        assert status in [TerminalStatus.PROCESSING, TerminalStatus.COMPLETED]
 
-            # Send a simple query
-            simple_query = "Say 'Hello, integration test!'"
-            tmux_client.send_keys(test_session_name, window_name, simple_query)
+        # Wait for completion (max 30 seconds)
+        status = wait_for_status(provider, {TerminalStatus.COMPLETED}, timeout=30.0)
 
-            # Wait for processing
-            time.sleep(1)
-            status = provider.get_status()
-            assert status in [TerminalStatus.PROCESSING, TerminalStatus.COMPLETED]
-
-            # Wait for completion (max 30 seconds)
-            max_wait = 30
-            elapsed = 0
-            while elapsed < max_wait:
-                status = provider.get_status()
-                if status == TerminalStatus.COMPLETED:
-                    break
-                time.sleep(1)
-                elapsed += 1
-
-            # Verify we got a completed response
-            assert status == TerminalStatus.COMPLETED
-
-            # Extract and verify the message
-            output = tmux_client.get_history(test_session_name, window_name)
-            message = provider.extract_last_message_from_script(output)
+        # Verify we got a completed response
+        assert status == TerminalStatus.COMPLETED
 
-            # Message should contain something (not empty)
-            assert len(message) > 0
-            assert "\x1b[" not in message  # ANSI codes cleaned
+        # Extract and verify the message
+        output = tmux_client.get_history(session_name, window_name)
+        message = provider.extract_last_message_from_script(output)
 
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+        # Message should contain something (not empty)
+        assert len(message) > 0
+        assert strip_ansi(message) == message  # ANSI codes cleaned
 
-    def test_real_q_chat_status_detection(
-        self, ensure_test_agent, test_session_name, cleanup_session
-    ):
+    def test_real_q_chat_status_detection(self, q_chat):
         """Test status detection with real Q CLI output."""
-        # Create a test tmux session
-        terminal_id = "test1234"
-        window_name = "window-0"
-        tmux_client.create_session(test_session_name, window_name, terminal_id)
+        provider, session_name, window_name = q_chat
 
-        try:
-            # Initialize Q CLI (using agent from ensure_test_agent fixture)
-            provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
-            provider.initialize()
+        # Test IDLE status (the reset fixture waits for it)
+        assert provider.get_status() == TerminalStatus.IDLE
 
-            # Test IDLE status
-            time.sleep(2)
-            assert provider.get_status() == TerminalStatus.IDLE
+        # Send a query to trigger PROCESSING/COMPLETED states
+        tmux_client.send_keys(session_name, window_name, "What is 2+2?")
 
-            # Send a query to trigger PROCESSING/COMPLETED states
-            tmux_client.send_keys(test_session_name, window_name, "What is 2+2?")
+        # Should be PROCESSING or quickly move to COMPLETED
+        status = wait_for_status(
+            provider, {TerminalStatus.PROCESSING, TerminalStatus.COMPLETED}, timeout=5.0
+        )
+        assert status in [TerminalStatus.PROCESSING, TerminalStatus.COMPLETED]
 
-            # Should be PROCESSING or quickly move to COMPLETED
-            time.sleep(1)
-            status = provider.get_status()
-            assert status in [TerminalStatus.PROCESSING, TerminalStatus.COMPLETED]
-
-            # Wait for completion
-            max_wait = 30
-            elapsed = 0
-            while elapsed < max_wait:
-                status = provider.get_status()
-                if status == TerminalStatus.COMPLETED:
-                    break
-                time.sleep(1)
-                elapsed += 1
-
-            # Should be COMPLETED
-            assert status == TerminalStatus.COMPLETED
-
-            # After some time, should return to IDLE (if we send Enter)
-            time.sleep(1)
-            tmux_client.send_keys(test_session_name, window_name, "")
-            time.sleep(1)
-
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+        # Wait for completion
+        status = wait_for_status(provider, {TerminalStatus.COMPLETED}, timeout=30.0)
+
+        # Should be COMPLETED
+        assert status == TerminalStatus.COMPLETED
+
+        # After some time, should return to IDLE (if we send Enter)
+        time.sleep(1)
+        tmux_client.send_keys(session_name, window_name, "")
+        time.sleep(1)
 
     def test_real_q_chat_exit(self, ensure_test_agent, test_session_name, cleanup_session):
         """Test exiting Q CLI."""
@@ -212,269 +227,224 @@ class TestQCliProviderIntegration:
         window_name = "window-0"
         tmux_client.create_session(test_session_name, window_name, terminal_id)
 
-        try:
-            # Initialize Q CLI (using agent from ensure_test_agent fixture)
-            provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
-            provider.initialize()
-
-            time.sleep(2)
-            assert provider.get_status() == TerminalStatus.IDLE
+        # Initialize Q CLI (using agent from ensure_test_agent fixture)
+        provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
+        provider.initialize()
 
-            # Send exit command
-            exit_cmd = provider.exit_cli()
-            tmux_client.send_keys(test_session_name, window_name, exit_cmd)
+        status = wait_for_status(provider, {TerminalStatus.IDLE}, timeout=5.0)
+        assert status == TerminalStatus.IDLE
 
-            # Wait for exit
-            time.sleep(2)
+        # Send exit command
+        exit_cmd = provider.exit_cli()
+        tmux_client.send_keys(test_session_name, window_name, exit_cmd)
 
-            # Get the output to verify exit happened
-            output = tmux_client.get_history(test_session_name, window_name)
+        # Wait for exit
+        time.sleep(2)
 
-            # Should not have the Q CLI prompt anymore after exit
-            # (This test verifies the exit command works)
-            assert "/exit" in output or "exit" in output.lower()
+        # Get the output to verify exit happened
+        output = tmux_client.get_history(test_session_name, window_name)
 
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+        # Should not have the Q CLI prompt anymore after exit
+        # (This test verifies the exit command works)
+        assert "/exit" in output or "exit" in output.lower()
 
     def test_real_q_chat_with_different_profile(
         self, ensure_test_agent, test_session_name, cleanup_session
     ):
         """Test Q CLI with a different agent profile if available."""
+        # Skip up front when the profile is absent instead of letting
+        # initialize spin out its full timeout before the old skip fired
+        if not (Q_AGENT_DIR / "test-agent.json").exists():
+            pytest.skip("test-agent profile not configured")
+
         # Create a test tmux session
         terminal_id = "test1234"
         window_name = "window-0"
         tmux_client.create_session(test_session_name, window_name, terminal_id)
 
-        try:
-            # Try with a different profile (may not exist, that's okay)
-            provider = QCliProvider(terminal_id, test_session_name, window_name, "test-agent")
-
-            # Initialize - may fail if profile doesn't exist
-            try:
-                result = provider.initialize()
-                # If it succeeds, verify basic functionality
-                if result:
-                    time.sleep(2)
-                    status = provider.get_status()
-                    # Status should be IDLE or ERROR (if profile doesn't exist)
-                    assert status in [TerminalStatus.IDLE, TerminalStatus.ERROR]
-            except TimeoutError:
-                # Profile may not exist, that's acceptable
-                pytest.skip("Test profile not available")
-
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+        provider = QCliProvider(terminal_id, test_session_name, window_name, "test-agent")
+
+        result = provider.initialize()
+        # If it succeeds, verify basic functionality
+        if result:
+            status = wait_for_status(
+                provider, {TerminalStatus.IDLE, TerminalStatus.ERROR}, timeout=5.0
+            )
+            assert status in [TerminalStatus.IDLE, TerminalStatus.ERROR]
 
 
+@pytest.mark.xdist_group(name="q-cli-shared")
 class TestQCliProviderHandoffIntegration:
     """Integration tests for handoff scenarios."""
 
-    def test_real_handoff_status_transitions(
-        self, ensure_test_agent, test_session_name, cleanup_session
-    ):
+    def test_real_handoff_status_transitions(self, q_chat):
         """Test status transitions during a real handoff scenario."""
-        # Create a test tmux session
-        terminal_id = "test1234"
-        window_name = "window-0"
-        tmux_client.create_session(test_session_name, window_name, terminal_id)
-
-        try:
-            # Initialize Q CLI with supervisor agent
-            # Note: This assumes a supervisor agent exists. If not, will use developer.
-            provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
-            provider.initialize()
-
-            # Wait for IDLE status
-            time.sleep(2)
-            assert provider.get_status() == TerminalStatus.IDLE
-
-            # Send a query that might trigger handoff-like behavior
-            # (Real handoff depends on agent configuration)
-            handoff_query = "Please help me with implementing a new feature"
-            tmux_client.send_keys(test_session_name, window_name, handoff_query)
-
-            # Monitor status transitions
-            statuses = []
-            max_wait = 30
-            elapsed = 0
-
-            while elapsed < max_wait:
-                status = provider.get_status()
-                statuses.append(status)
+        provider, session_name, window_name = q_chat
 
-                # Break if we reach COMPLETED or ERROR
-                if status in [TerminalStatus.COMPLETED, TerminalStatus.ERROR]:
-                    break
+        # Send a query that might trigger handoff-like behavior
+        # (Real handoff depends on agent configuration)
+        handoff_query = "Please help me with implementing a new feature"
+        tmux_client.send_keys(session_name, window_name, handoff_query)
 
-                time.sleep(1)
-                elapsed += 1
-
-            # Verify we got through the expected states
-            assert TerminalStatus.PROCESSING in statuses or TerminalStatus.COMPLETED in statuses
+        # Wait until the query resolves one way or the other, recording
+        # every status change seen along the way
+        result = wait_for_status(
+            provider, {TerminalStatus.COMPLETED, TerminalStatus.ERROR}, timeout=30.0, record=True
+        )
 
-            # Extract the message if completed
-            if statuses[-1] == TerminalStatus.COMPLETED:
-                output = tmux_client.get_history(test_session_name, window_name)
-                message = provider.extract_last_message_from_script(output)
+        # Verify the query was picked up and ran to a terminal state
+        assert result.status in [TerminalStatus.COMPLETED, TerminalStatus.ERROR]
+        assert (
+            TerminalStatus.PROCESSING in result.transitions
+            or TerminalStatus.COMPLETED in result.transitions
+        )
 
-                # Verify message extraction worked
-                assert len(message) > 0
-                assert "\x1b[" not in message  # ANSI codes cleaned
+        # Extract the message if completed
+        if result.status == TerminalStatus.COMPLETED:
+            output = tmux_client.get_history(session_name, window_name)
+            message = provider.extract_last_message_from_script(output)
 
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+            # Verify message extraction worked
+            assert len(message) > 0
+            assert strip_ansi(message) == message  # ANSI codes cleaned
 
-    def test_real_handoff_message_integrity(
-        self, ensure_test_agent, test_session_name, cleanup_session
-    ):
+    def test_real_handoff_message_integrity(self, q_chat):
         """Test that message extraction maintains integrity during handoff."""
-        # Create a test tmux session
-        terminal_id = "test1234"
-        window_name = "window-0"
-        tmux_client.create_session(test_session_name, window_name, terminal_id)
-
-        try:
-            # Initialize Q CLI
-            provider = QCliProvider(terminal_id, test_session_name, window_name, ensure_test_agent)
-            provider.initialize()
-
-            time.sleep(2)
-            assert provider.get_status() == TerminalStatus.IDLE
-
-            # Send a simple query (shorter to avoid buffer truncation)
-            query = "Say 'Test message integrity'"
-            tmux_client.send_keys(test_session_name, window_name, query)
-
-            # Wait for processing to start
-            time.sleep(1)
-            initial_status = provider.get_status()
-
-            # If already completed, we're done
-            if initial_status == TerminalStatus.COMPLETED:
-                status = initial_status
-            else:
-                # Otherwise wait for completion
-                if initial_status != TerminalStatus.PROCESSING:
-                    # Debug: print terminal output if not in expected state
-                    debug_output = tmux_client.get_history(test_session_name, window_name)
-                    print(f"\n=== DEBUG: Unexpected initial status ===")
-                    print(f"Status: {initial_status}")
-                    print(f"Terminal output:\n{debug_output}")
-                    print("=" * 50)
-                assert (
-                    initial_status == TerminalStatus.PROCESSING
-                ), f"Expected PROCESSING but got {initial_status}"
-
-                max_wait = 30
-                elapsed = 0
-                status_history = [initial_status]
-                while elapsed < max_wait:
-                    status = provider.get_status()
-                    if status != status_history[-1]:
-                        status_history.append(status)
-                    if status == TerminalStatus.COMPLETED:
-                        break
-                    time.sleep(1)
-                    elapsed += 1
-
-                if status != TerminalStatus.COMPLETED:
-                    # Debug: print terminal output on failure
-                    debug_output = tmux_client.get_history(test_session_name, window_name)
-                    print(f"\n=== DEBUG: Test failed ===")
-                    print(f"Final status: {status}")
-                    print(f"Status history: {status_history}")
-                    print(f"Terminal output:\n{debug_output}")
-                    print("=" * 50)
-
-                assert (
-                    status == TerminalStatus.COMPLETED
-                ), f"Expected COMPLETED but got {status} after {elapsed} seconds. Status history: {status_history}"
-
-            # Get the output
-            output = tmux_client.get_history(test_session_name, window_name)
-
-            # Extract message and verify indices weren't corrupted
-            message = provider.extract_last_message_from_script(output)
+        provider, session_name, window_name = q_chat
 
-            # Verify message quality
-            assert len(message) > 0
-            assert "\x1b[" not in message  # All ANSI codes removed
-            assert not message.startswith("[")  # No partial ANSI codes
-            assert not message.endswith("\x1b")  # No trailing escape chars
+        # Send a simple query (shorter to avoid buffer truncation)
+        query = "Say 'Test message integrity'"
+        tmux_client.send_keys(session_name, window_name, query)
 
-            # Message should be coherent (no index corruption)
-            # A corrupted extraction would have fragments or missing parts
-            assert len(message.split()) >= 3  # Should have multiple words
-            assert "Test message integrity" in message  # Should contain our expected phrase
+        # Wait for processing to start
+        initial_status = wait_for_status(
+            provider, {TerminalStatus.PROCESSING, TerminalStatus.COMPLETED}, timeout=5.0
+        )
 
-        finally:
-            # Cleanup
-            tmux_client.kill_session(test_session_name)
+        # If already completed, we're done
+        if initial_status == TerminalStatus.COMPLETED:
+            status = initial_status
+        else:
+            # Otherwise wait for completion
+            if initial_status != TerminalStatus.PROCESSING:
+                # Debug: print terminal output if not in expected state
+                debug_output = tmux_client.get_history(session_name, window_name)
+                print(f"\n=== DEBUG: Unexpected initial status ===")
+                print(f"Status: {initial_status}")
+                print(f"Terminal output:\n{debug_output}")
+                print("=" * 50)
+            assert (
+                initial_status == TerminalStatus.PROCESSING
+            ), f"Expected PROCESSING but got {initial_status}"
+
+            status = wait_for_status(provider, {TerminalStatus.COMPLETED}, timeout=30.0)
+
+            if status != TerminalStatus.COMPLETED:
+                # Debug: print terminal output on failure
+                debug_output = tmux_client.get_history(session_name, window_name)
+                print(f"\n=== DEBUG: Test failed ===")
+                print(f"Final status: {status}")
+                print(f"Terminal output:\n{debug_output}")
+                print("=" * 50)
+
+            assert (
+                status == TerminalStatus.COMPLETED
+            ), f"Expected COMPLETED but got {status} after waiting 30 seconds"
+
+        # Get the output
+        output = tmux_client.get_history(session_name, window_name)
+
+        # Extract message and verify indices weren't corrupted
+        message = provider.extract_last_message_from_script(output)
+
+        # Verify message quality
+        assert len(message) > 0
+        # The single-pass scanner and the provider's regex pipeline must agree:
+        # a fully cleaned message is a fixed point of strip_ansi
+        assert strip_ansi(message) == message  # All ANSI codes removed
+        assert not message.startswith("[")  # No partial ANSI codes
+        assert not message.endswith("\x1b")  # No trailing escape chars
+
+        # Message should be coherent (no index corruption)
+        # A corrupted extraction would have fragments or missing parts
+        assert len(message.split()) >= 3  # Should have multiple words
+        assert "Test message integrity" in message  # Should contain our expected phrase
+
+
+@pytest.fixture(scope="class")
+def wd_session(tmp_path_factory):
+    """One tmux session shared by the working-directory tests.
+
+    Session creation and shell startup dominate these tests, so pay for them
+    once: each test cds into its own tmp_path instead of spawning a session
+    there. The shell is ready on yield (wait_for_shell), so tests can send
+    commands immediately.
+    """
+    session_name = f"test-q-cli-wd-{_worker_id()}-{uuid.uuid4().hex[:8]}"
+    start_dir = tmp_path_factory.mktemp("wd-session-root")
+    window_name = tmux_client.create_session(
+        session_name, "test-window", "test-term-id", working_directory=str(start_dir)
+    )
+    wait_for_shell(tmux_client, session_name, window_name, timeout=10.0)
+    try:
+        yield session_name, window_name, start_dir
+    finally:
+        try:
+            tmux_client.kill_session(session_name)
+        except Exception:
+            pass  # Session may already be cleaned up
 
 
+@pytest.mark.xdist_group(name="q-cli-workdir")
 class TestQCliProviderWorkingDirectory:
     """Integration tests for working directory functionality."""
 
-    def test_session_starts_in_custom_directory(self, test_session_name, cleanup_session, tmp_path):
+    def test_session_starts_in_custom_directory(self, wd_session):
         """Test that terminal starts in specified working directory."""
-        # Create session with custom working directory
-        window_name = tmux_client.create_session(
-            test_session_name, "test-window", "test-term-id", working_directory=str(tmp_path)
-        )
+        session_name, window_name, start_dir = wd_session
 
-        # Query the working directory
-        actual_dir = tmux_client.get_pane_working_directory(test_session_name, window_name)
+        # Query the directory the session was created with
+        actual_dir = tmux_client.get_pane_working_directory(session_name, window_name)
 
-        assert actual_dir == str(tmp_path.resolve())
+        assert actual_dir == str(start_dir.resolve())
 
-    def test_working_directory_changes_are_detected(
-        self, test_session_name, cleanup_session, tmp_path
-    ):
+    def test_working_directory_changes_are_detected(self, wd_session, tmp_path):
         """Test that directory changes in terminal are detected."""
-        # Create session
-        window_name = tmux_client.create_session(
-            test_session_name, "test-window", "test-term-id", working_directory=str(tmp_path)
-        )
+        session_name, window_name, _ = wd_session
 
         # Create subdirectory
         subdir = tmp_path / "subdir"
         subdir.mkdir()
 
-        # Change directory in tmux pane
-        # wait_for_shell ensures shell is initialized before sending commands
-        # (paste-buffer delivery is instant, so shell must be ready first)
-        wait_for_shell(tmux_client, test_session_name, window_name, timeout=10.0)
-        tmux_client.send_keys(test_session_name, window_name, f"cd {subdir}")
-        time.sleep(0.5)  # Wait for command to execute
+        # Change directory in tmux pane, then poll until tmux reflects it
+        tmux_client.send_keys(session_name, window_name, f"cd {subdir}")
 
-        # Query working directory
-        actual_dir = tmux_client.get_pane_working_directory(test_session_name, window_name)
-
-        assert actual_dir == str(subdir.resolve())
+        assert wait_until(
+            lambda: tmux_client.get_pane_working_directory(session_name, window_name)
+            == str(subdir.resolve())
+        )
 
-    def test_symlink_resolution(self, test_session_name, cleanup_session, tmp_path):
+    def test_symlink_resolution(self, wd_session, tmp_path):
         """Test that symlinks are resolved to real paths."""
+        session_name, window_name, _ = wd_session
+
         # Create real directory and symlink
         real_dir = tmp_path / "real"
         real_dir.mkdir()
         link_dir = tmp_path / "link"
         link_dir.symlink_to(real_dir)
 
-        # Create session with symlink path
-        window_name = tmux_client.create_session(
-            test_session_name, "test-window", "test-term-id", working_directory=str(link_dir)
-        )
+        # cd through the symlink; the pane cwd reflects the resolved path
+        tmux_client.send_keys(session_name, window_name, f"cd {link_dir}")
 
         # Should resolve to real path
-        actual_dir = tmux_client.get_pane_working_directory(test_session_name, window_name)
-
-        assert actual_dir == str(real_dir.resolve())
+        assert wait_until(
+            lambda: tmux_client.get_pane_working_directory(session_name, window_name)
+            == str(real_dir.resolve())
+        )
 
 
+@pytest.mark.xdist_group(name="q-cli-errors")
 class TestQCliProviderIntegrationErrorHandling:
     """Integration tests for error scenarios."""
 
@@ -482,9 +452,11 @@ class TestQCliProviderIntegrationErrorHandling:
         """Test handling of invalid session."""
         provider = QCliProvider("test1234", "non-existent-session", "window-0", "developer")
 
-        # Should raise an error or timeout when trying to initialize
-        # with a non-existent session
-        with pytest.raises((TimeoutError, Exception)):
+        # capture-pane fails immediately for a missing session and get_history
+        # translates that to its not-found ValueError, so initialize raises
+        # without sitting out the shell timeout; TimeoutError stays allowed
+        # for environments where the capture itself doesn't fail fast
+        with pytest.raises((ValueError, TimeoutError)):
             provider.initialize()
 
     def test_get_status_with_nonexistent_session(self, q_cli_available):
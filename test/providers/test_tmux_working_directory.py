@@ -14,23 +14,30 @@ class TestTmuxClientWorkingDirectory:
 
     @pytest.fixture(autouse=True)
     def mock_tmux_server(self):
-        """Mock libtmux.Server for all tests in this class."""
-        with patch("cli_agent_orchestrator.clients.tmux.libtmux.Server") as mock_server_class:
-            self.mock_server_class = mock_server_class
-            self.mock_server = MagicMock()
-            mock_server_class.return_value = self.mock_server
-            yield mock_server_class
+        """Mock libtmux.Server for all tests in this class.
 
-    def test_resolve_defaults_to_cwd(self):
+        Also disables the control-mode pipe and the subprocess fallback so
+        queries exercise the mocked libtmux path instead of a real tmux server.
+        """
+        with patch("cli_agent_orchestrator.clients.tmux.libtmux.Server") as mock_server_class:
+            with patch("cli_agent_orchestrator.clients.tmux._ControlModeConnection") as mock_cm:
+                with patch("cli_agent_orchestrator.clients.tmux.subprocess") as mock_subprocess:
+                    mock_cm.return_value.run.side_effect = RuntimeError("control mode disabled")
+                    mock_subprocess.run.side_effect = RuntimeError("subprocess disabled")
+                    self.mock_server_class = mock_server_class
+                    self.mock_server = MagicMock()
+                    mock_server_class.return_value = self.mock_server
+                    yield mock_server_class
+
+    def test_resolve_defaults_to_cwd(self, tmp_path, monkeypatch):
         """Test that None defaults to current working directory."""
         client = TmuxClient()
-        with patch("os.getcwd", return_value="/current/dir"):
-            with patch("os.path.isdir", return_value=True):
-                result = client._resolve_and_validate_working_directory(None)
-                assert result == os.path.realpath("/current/dir")
+        monkeypatch.chdir(tmp_path)
+        result = client._resolve_and_validate_working_directory(None)
+        assert result == os.getcwd()
 
-    def test_resolve_symlinks(self, tmp_path):
-        """Test that symlinks are resolved to real paths."""
+    def test_symlinks_accepted_without_resolution(self, tmp_path):
+        """Test that symlinked directories validate but are not resolved."""
         client = TmuxClient()
 
         # Create real directory and symlink
@@ -40,7 +47,17 @@ class TestTmuxClientWorkingDirectory:
         link_dir.symlink_to(real_dir)
 
         result = client._resolve_and_validate_working_directory(str(link_dir))
-        assert result == str(real_dir.resolve())
+        assert result == str(link_dir)
+        assert os.path.samefile(result, real_dir)
+
+    def test_raises_for_non_directory(self, tmp_path):
+        """Test ValueError when the path is a file rather than a directory."""
+        client = TmuxClient()
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("not a dir")
+
+        with pytest.raises(ValueError, match="Working directory does not exist"):
+            client._resolve_and_validate_working_directory(str(file_path))
 
     def test_raises_for_nonexistent_directory(self):
         """Test ValueError for non-existent directory."""
@@ -89,7 +106,7 @@ class TestTmuxClientWorkingDirectory:
 
         assert result is None
 
-    def test_create_session_with_working_directory(self):
+    def test_create_session_with_working_directory(self, tmp_path):
         """Test create_session passes working_directory to tmux."""
         mock_session = Mock()
         mock_window = Mock()
@@ -99,18 +116,14 @@ class TestTmuxClientWorkingDirectory:
         self.mock_server.new_session.return_value = mock_session
 
         client = TmuxClient()
-        with patch("os.path.isdir", return_value=True):
-            with patch("os.path.realpath", return_value="/test/dir"):
-                result = client.create_session(
-                    "test-session", "test-window", "terminal-1", "/test/dir"
-                )
+        result = client.create_session("test-session", "test-window", "terminal-1", str(tmp_path))
 
         assert result == "test-window"
         self.mock_server.new_session.assert_called_once()
         call_args = self.mock_server.new_session.call_args
-        assert call_args[1]["start_directory"] == "/test/dir"
+        assert call_args[1]["start_directory"] == str(tmp_path)
 
-    def test_create_session_defaults_working_directory(self):
+    def test_create_session_defaults_working_directory(self, tmp_path, monkeypatch):
         """Test create_session with None working_directory."""
         mock_session = Mock()
         mock_window = Mock()
@@ -120,19 +133,15 @@ class TestTmuxClientWorkingDirectory:
         self.mock_server.new_session.return_value = mock_session
 
         client = TmuxClient()
-        with patch("os.getcwd", return_value="/current/dir"):
-            with patch("os.path.isdir", return_value=True):
-                with patch("os.path.realpath", return_value="/current/dir"):
-                    result = client.create_session(
-                        "test-session", "test-window", "terminal-1", None
-                    )
+        monkeypatch.chdir(tmp_path)
+        result = client.create_session("test-session", "test-window", "terminal-1", None)
 
         assert result == "test-window"
         self.mock_server.new_session.assert_called_once()
         call_args = self.mock_server.new_session.call_args
-        assert call_args[1]["start_directory"] == "/current/dir"
+        assert call_args[1]["start_directory"] == os.getcwd()
 
-    def test_create_window_with_working_directory(self):
+    def test_create_window_with_working_directory(self, tmp_path):
         """Test create_window passes working_directory to tmux."""
         mock_session = Mock()
         mock_window = Mock()
@@ -142,16 +151,12 @@ class TestTmuxClientWorkingDirectory:
         mock_session.new_window.return_value = mock_window
 
         client = TmuxClient()
-        with patch("os.path.isdir", return_value=True):
-            with patch("os.path.realpath", return_value="/test/dir"):
-                result = client.create_window(
-                    "test-session", "test-window", "terminal-1", "/test/dir"
-                )
+        result = client.create_window("test-session", "test-window", "terminal-1", str(tmp_path))
 
         assert result == "test-window"
         mock_session.new_window.assert_called_once()
         call_args = mock_session.new_window.call_args
-        assert call_args[1]["start_directory"] == "/test/dir"
+        assert call_args[1]["start_directory"] == str(tmp_path)
 
     def test_get_pane_working_directory_window_not_found(self):
         """Test returns None when window not found."""